@@ -12,6 +12,18 @@ from amphimixis.amixis.console_animation_printer import ConsoleAnimationPrinter
 from amphimixis.amixis.parser import MAIN_EXAMPLES
 from amphimixis.core.general.constants import DEFAULT_CONFIG_PATH
 
+MAIN_HELP = """\
+amixis [-h] {run, analyze, build, profile, validate, compare, clean, add} ...
+
+Amphimixis — an automated project intelligence and evaluation tool
+for performance and migration readiness.
+
+options:
+  -h, --short-help  show short help without examples
+  --help           show full help with examples
+
+subcommands:"""
+
 
 def print_help(commands, full=False) -> None:
     """Print short help without examples.
@@ -20,21 +32,11 @@ def print_help(commands, full=False) -> None:
     :param bool full: Whether to show full help with examples
     """
 
-    print(
-        "amixis [-h] {run, analyze, build, profile, validate, compare, clean, add} ...\n"
-    )
-    print(
-        "Amphimixis — an automated project intelligence and evaluation tool\n"
-        "for performance and migration readiness.\n"
-    )
-    print("options:")
-    print("  -h, --short-help  show short help without examples")
-    print("  --help           show full help with examples\n")
-    print("subcommands:")
-    for name, cmd in commands.items():
-        print(f"  {name:12} - {cmd.HELP_MESSAGE}")
+    lines = [MAIN_HELP]
+    lines.extend(f"  {name:12} - {cmd.HELP_MESSAGE}" for name, cmd in commands.items())
     if full:
-        print("\n" + MAIN_EXAMPLES)
+        lines.append("\n" + MAIN_EXAMPLES)
+    print("\n".join(lines))
 
 
 # pylint: disable=too-many-branches
@@ -76,9 +78,7 @@ def main() -> bool:
 
     config_file = None
     if args.command in ("run", "build", "profile"):
-        config_file = DEFAULT_CONFIG_PATH
-        if args.config is not None:
-            config_file = Path(args.config).expanduser().resolve()
+        config_file = Path(args.config or DEFAULT_CONFIG_PATH).expanduser().resolve()
 
     target_events = args.events if hasattr(args, "events") else None
     match args.command:
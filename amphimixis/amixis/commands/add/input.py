@@ -25,7 +25,7 @@ def run_add_input() -> bool:
     :rtype: bool
     """
 
-    base_path = DEFAULT_CONFIG_PATH
+    base_path = DEFAULT_CONFIG_PATH.resolve()
     editor = os.environ.get("EDITOR", "nano")
     current_content = CONFIG_TEMPLATE
 
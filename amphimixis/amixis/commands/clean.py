@@ -1,6 +1,7 @@
 """Clean command."""
 
 import pickle
+import sys
 from argparse import ArgumentParser, Namespace
 
 from amphimixis.core import Builder
@@ -31,13 +32,15 @@ def add_args(parser: ArgumentParser) -> None:
 def open_alternate_term() -> None:
     """Uses Xterm control code to switch to an alternate terminal buffer"""
 
-    print("\033[?1049h", end="")
+    sys.stdout.write("\033[?1049h")
+    sys.stdout.flush()
 
 
 def close_alternate_term() -> None:
     """Uses Xterm control code to return back to first terminal buffer"""
 
-    print("\033[?1049l", end="")
+    sys.stdout.write("\033[?1049l")
+    sys.stdout.flush()
 
 
 def clean(*builds: Build) -> bool:
@@ -95,7 +98,7 @@ def interactive_clean() -> bool:
                     print(f"{build.build_name} failed to clean")
     except ValueError:
         print("Invalid input. Please enter numbers separated by spaces.")
-    except KeyboardInterrupt:
+    except (EOFError, KeyboardInterrupt):
         print("Cancelled")
     return success
 
@@ -124,4 +127,7 @@ def run_clean(args: Namespace) -> bool:
             print("No matching builds found")
             return False
         return clean(*to_clean)
+    if sys.stdin is None:
+        print("Specify build names or --all to clean with closed stdin")
+        return False
     return interactive_clean()
@@ -1,6 +1,7 @@
 """Run command - full pipeline."""
 
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 
 from amphimixis.amixis.utils import add_config_arg, add_events_arg, add_path_arg
 from amphimixis.core.general import IUI, Project, constants, tools, ProjectStats
@@ -100,8 +101,13 @@ def run_full_pipeline(
     :rtype: bool
     """
 
-    if not run_analyze(project, ui):
-        return False
+    # parse_config may rely on the analysis results, so only reading
+    # of the config file is overlapped with the analysis. Its errors are
+    # ignored here and reported by parse_config.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(tools.load_yaml, str(config_file))
+        if not run_analyze(project, ui):
+            return False
 
     if not run_build(project, str(config_file), ui):
         return False
@@ -1,14 +1,30 @@
 """Single-line spinner for build progress display"""
 
+import shutil
+import signal
 import sys
+import threading
+import time
 
 from amphimixis.core.general import IUI
 
 
 class ConsoleAnimationPrinter(IUI):
-    """Single-line console spinner implementation of IUI."""
+    """Single-line console spinner implementation of IUI.
+
+    `step` is called concurrently by the stdout and stderr readers of Shell.
+    A reader that finds the spinner busy skips its step instead of waiting for it.
+    The rest of the methods are called only by the thread running the pipeline.
+    The line text is replaced as a whole, so a frame never mixes parts of
+    an old and a new message.
+
+    On a terminal spinner frames are cut to its width, since a wrapped line can't
+    be erased by returning the carriage. The width is updated on SIGWINCH.
+    """
 
     braille: list[str] = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    braille_count: int = len(braille)
+    frame_interval: float = 0.1
     build_id: str
     index: int
     message: str
@@ -19,6 +35,35 @@ class ConsoleAnimationPrinter(IUI):
         self.index = 0
         self.message = ""
         self.status = "running"
+        # text before and after the spinner symbol
+        self._line_parts = ("[][", "] ")
+        self._last_line = ""
+        self._last_step_time = 0.0
+        self._step_lock = threading.Lock()
+        # None means that frames are not cut (stdout is not a terminal)
+        self._columns: int | None = None
+        if sys.stdout.isatty():
+            self._columns = shutil.get_terminal_size().columns
+        # signal handlers can be set only from the main thread
+        if (
+            self._columns is not None
+            and hasattr(signal, "SIGWINCH")
+            and threading.current_thread() is threading.main_thread()
+        ):
+            signal.signal(signal.SIGWINCH, self._update_columns)
+
+    def __getstate__(self) -> dict:
+        """Drop the step lock, which can't be pickled, from the pickled state."""
+
+        state = self.__dict__.copy()
+        del state["_step_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state with a new step lock."""
+
+        self.__dict__.update(state)
+        self._step_lock = threading.Lock()
 
     def send_message(self, sender: str, message: str) -> None:
         """Print message to user with status mark 'I'
@@ -27,7 +72,7 @@ class ConsoleAnimationPrinter(IUI):
         :param str message: Message to user
         """
 
-        print(f"\r\033[K[{sender}][I] {message}")
+        self._write(f"\r\033[K[{sender}][I] {message}\n")
 
     def send_warning(self, sender: str, warning: str) -> None:
         """Print warning to user with status mark 'W' and 'WARNING: ' in begin of message
@@ -36,7 +81,7 @@ class ConsoleAnimationPrinter(IUI):
         :param str warning: Warning to user
         """
 
-        print(f"\r\033[K[{sender}][W] WARNING: {warning}")
+        self._write(f"\r\033[K[{sender}][W] WARNING: {warning}\n")
 
     def send_error(self, sender: str, err_msg: str) -> None:
         """Print error to user with status mark 'E' and 'ERROR: ' in begin of message
@@ -45,7 +90,7 @@ class ConsoleAnimationPrinter(IUI):
         :param str err_msg: Error message to user
         """
 
-        print(f"\r\033[K[{sender}][E] ERROR: {err_msg}")
+        self._write(f"\r\033[K[{sender}][E] ERROR: {err_msg}\n")
 
     def update_message(self, build_id: str, message: str) -> None:
         """Update build_id and message.
@@ -58,15 +103,31 @@ class ConsoleAnimationPrinter(IUI):
             self.status = "running"
             self.index = 0
 
-        self.build_id = build_id
-        self.message = message
+        self._set_text(build_id, message)
         self.draw()
 
     def step(self) -> None:
-        """Move to next spinner."""
+        """Move to next spinner.
 
-        self.index = (self.index + 1) % len(self.braille)
-        self.draw()
+        Steps coming faster than `frame_interval` seconds are coalesced.
+        """
+
+        # pylint: disable=consider-using-with
+        if not self._step_lock.acquire(blocking=False):
+            return
+
+        try:
+            now = time.monotonic()
+            if now - self._last_step_time < self.frame_interval:
+                return
+
+            self._last_step_time = now
+            self.index += 1
+            if self.index == self.braille_count:
+                self.index = 0
+            self.draw()
+        finally:
+            self._step_lock.release()
 
     def mark_success(self, message: str = "", build_id: str = "") -> None:
         """Mark as successful.
@@ -76,14 +137,8 @@ class ConsoleAnimationPrinter(IUI):
         """
 
         self.status = "success"
-        if build_id:
-            self.build_id = build_id
-
-        if message:
-            self.message = message
-
-        self.draw()
-        self.finalize()
+        self._set_text(build_id or self.build_id, message or self.message)
+        self.draw(end="\n")
 
     def mark_failed(self, error_message: str = "", build_id: str = "") -> None:
         """Mark as failed and optionally update message.
@@ -93,18 +148,27 @@ class ConsoleAnimationPrinter(IUI):
         """
 
         self.status = "failed"
+        self._set_text(build_id or self.build_id, error_message or self.message)
+        self.draw(end="\n")
+
+    def _set_text(self, build_id: str, message: str) -> None:
+        """Set build_id and message and prepare the line parts around the spinner.
+
+        :param str build_id: Build identifier
+        :param str message: Message describing current build phase
+        """
 
-        if build_id:
-            self.build_id = build_id
+        self.build_id = build_id
+        self.message = message
+        self._line_parts = (f"[{build_id}][", f"] {message}")
 
-        if error_message:
-            self.message = error_message
+    def draw(self, end: str = "") -> None:
+        """Draw current state to stdout.
 
-        self.draw()
-        self.finalize()
+        The terminal is not touched if the line is the same as the last drawn one.
 
-    def draw(self) -> None:
-        """Draw current state to stdout."""
+        :param str end: String written right after the line in the same write call
+        """
 
         if self.status == "success":
             symbol = "✓"
@@ -113,11 +177,33 @@ class ConsoleAnimationPrinter(IUI):
         else:
             symbol = self.braille[self.index]
 
-        sys.stdout.write(f"\r\033[K[{self.build_id}][{symbol}] {self.message}")
+        prefix, suffix = self._line_parts
+        line = prefix + symbol + suffix
+        if not end and self._columns is not None:
+            line = line[: self._columns - 1]
+        if line == self._last_line and not end:
+            return
+
+        self._last_line = "" if end else line
+        sys.stdout.write(f"\r\033[K{line}{end}")
+        sys.stdout.flush()
+
+    def _update_columns(self, _signum, _frame) -> None:
+        """Re-read terminal width after the terminal has been resized."""
+
+        self._columns = shutil.get_terminal_size().columns
+
+    def _write(self, text: str) -> None:
+        """Write text that overwrites the spinner line and flush it.
+
+        :param str text: Text to write, including the trailing newline
+        """
+
+        self._last_line = ""
+        sys.stdout.write(text)
         sys.stdout.flush()
 
     def finalize(self) -> None:
         """Move to next line."""
 
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        self._write("\n")
@@ -58,8 +58,7 @@ def parse_config(
         ui.mark_failed("Incorrect input file")
         return False
 
-    with open(config_file_path, "r", encoding="UTF-8") as file:
-        input_config = yaml.safe_load(file)
+    input_config = tools.load_yaml(config_file_path)
 
     build_system: str | None = str(input_config.get("build_system")).lower()
     if build_system not in build_systems_dict:
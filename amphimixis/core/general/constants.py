@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-DEFAULT_CONFIG_PATH = Path("input.yml").resolve()
+DEFAULT_CONFIG_PATH = Path("input.yml")
 
 AMPHIMIXIS_DIRECTORY_NAME = "amphimixis"
 ANALYZED_FILE_NAME = "amphimixis.analyzed"
@@ -228,6 +228,8 @@ class CompilerFlags:
 class IUI(ABC):
     """Interface for User Interface (UI) classes"""
 
+    __slots__ = ()
+
     @abstractmethod
     def step(self) -> None:
         """Advance the progress counter by one step."""
@@ -280,6 +282,8 @@ class IUI(ABC):
 class NullUI(IUI):
     """A UI implementation that does nothing (used to suppress output)"""
 
+    __slots__ = ()
+
     def step(self) -> None:
         pass
 
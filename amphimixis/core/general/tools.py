@@ -5,14 +5,21 @@ paths into filesystem-friendly filenames and decoding them back without losing
 information.
 """
 
+import copy
 import os
 import pickle
 import glob
 from pathlib import Path
+from typing import Any
+
+import yaml
 
 from amphimixis.core.general.constants import PERF_STATS_EXT
 from amphimixis.core.general.general import Project
 
+# absolute path -> ((mtime_ns, size), parsed content)
+_yaml_cache: dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 def build_filename(build_name: str, executable: str) -> str:
     """Build a readable filename that can be decoded back to original values.
@@ -135,6 +142,30 @@ def get_cache_project() -> Project:
         return project
 
 
+def load_yaml(file_path: str) -> Any:
+    """Load a YAML file, reusing the parsed content while the file is unchanged.
+
+    The file is considered unchanged while its modification time and size stay
+    the same, so repeated loads of one config cost a single `stat` call.
+
+    :param str file_path: Path to the YAML file.
+    :return: Deserialized file content. Every call returns an independent copy.
+    :raises OSError: If the file can't be read.
+    """
+
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _yaml_cache.get(abs_path)
+    if cached is None or cached[0] != signature:
+        with open(abs_path, "r", encoding="UTF-8") as file:
+            cached = (signature, yaml.safe_load(file))
+        _yaml_cache[abs_path] = cached
+
+    return copy.deepcopy(cached[1])
+
+
 def load_project_stats(project: Project):
     """Load serialized profiling statistics for a project.
 
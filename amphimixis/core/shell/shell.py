@@ -4,6 +4,7 @@ import os
 import socket
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import ArgumentError
 from typing import List, Self, Tuple
 
@@ -45,6 +46,10 @@ class Shell:
         self._is_connected: bool = False
         self._is_local: bool = False
         self._ui_lock = threading.Lock()
+        # stderr is drained in the background while stdout is read in place
+        self._stderr_reader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="shell-stderr"
+        )
 
     def connect(self) -> Self:
         """Connect to the shell of the machine."""
@@ -124,18 +129,11 @@ class Shell:
             cmd_stderr: List[str] = []
             command_error_code: List[int] = []
 
-            stdout_reader = threading.Thread(
-                target=self._read_stdout_until_barrier,
-                args=(cmd_stdout, command_error_code),
-            )
-            stderr_reader = threading.Thread(
-                target=self._read_stderr_until_barrier, args=(cmd_stderr,)
+            stderr_reader = self._stderr_reader.submit(
+                self._read_stderr_until_barrier, cmd_stderr
             )
-
-            stdout_reader.start()
-            stderr_reader.start()
-            stdout_reader.join()
-            stderr_reader.join()
+            self._read_stdout_until_barrier(cmd_stdout, command_error_code)
+            stderr_reader.result()
 
             error_code = command_error_code[0]
             stdout.append(cmd_stdout)
@@ -146,8 +144,10 @@ class Shell:
     def _read_stdout_until_barrier(
         self, output: List[str], error_code: List[int]
     ) -> None:
-        while line := self._shell.stdout_readline():
-            self._ui.step()
+        step = self._ui.step
+        readline = self._shell.stdout_readline
+        while line := readline():
+            step()
 
             barrier_error = self._parse_stdout_barrier(line)
             if barrier_error is not None:
@@ -158,8 +158,10 @@ class Shell:
             output.append(line)
 
     def _read_stderr_until_barrier(self, output: List[str]) -> None:
-        while line := self._shell.stderr_readline():
-            self._ui.step()
+        step = self._ui.step
+        readline = self._shell.stderr_readline
+        while line := readline():
+            step()
 
             if self._is_stderr_barrier(line):
                 self._strip_barrier_separator(output)
@@ -7,8 +7,6 @@ from os import path
 from re import compile as re_compile
 from typing import Any
 
-import yaml
-
 from amphimixis.core.build_systems import build_systems_dict, runners_dict
 from amphimixis.core.general import (
     IUI,
@@ -16,6 +14,7 @@ from amphimixis.core.general import (
     Arch,
     CompilerFlagsAttrs,
     ToolchainAttrs,
+    tools,
 )
 from amphimixis.core.laboratory_assistant import LaboratoryAssistant
 from amphimixis.core.logger import setup_logger
@@ -45,8 +44,7 @@ def validate(config_file_path: str, ui: IUI = NullUI()) -> bool:
         _logger.error("Config file not found")
         return False
 
-    with open(config_file_path, "r", encoding="UTF-8") as file:
-        input_config = yaml.safe_load(file)
+    input_config = tools.load_yaml(config_file_path)
 
     build_system = input_config.get("build_system")
     if (
@@ -0,0 +1,55 @@
+"""Clean command tests"""
+
+import io
+import pickle
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+from amphimixis.amixis.commands import clean
+from amphimixis.core import Builder
+from amphimixis.core.general import Arch, Build, MachineInfo, Project
+
+local_machine = MachineInfo(Arch.X86, None, None)
+build = Build(local_machine, local_machine, "build", [], None, None, None, None)
+
+
+@pytest.mark.unit
+class TestRunClean:
+    """Tests for run_clean without build names"""
+
+    @pytest.fixture
+    def builds_file(self, tmp_path, monkeypatch):
+        """Remember one build in a temporary working directory"""
+        monkeypatch.chdir(tmp_path)
+        with open(Builder.BUILDS_LIST_FILE_NAME, "wb") as file:
+            pickle.dump({build.build_name: build}, file)
+
+    def test_run_clean_with_closed_stdin_does_not_prompt(self, builds_file):
+        """Test run_clean when stdin is closed
+        Expect: Returns False without asking for input"""
+        with (
+            patch.object(clean.sys, "stdin", None),
+            patch("builtins.input") as mock_input,
+        ):
+            result = clean.run_clean(Namespace(all=False, build_names=[]))
+
+        assert result is False
+        mock_input.assert_not_called()
+
+    def test_run_clean_reads_piped_selection(self, builds_file, tmp_path):
+        """Test run_clean with build numbers piped to stdin
+        Expect: Selected build is cleaned"""
+        project = Project(str(tmp_path))
+
+        with (
+            patch.object(clean.sys, "stdin", io.StringIO("1\n")),
+            patch.object(clean.tools, "get_cache_project", return_value=project),
+            patch.object(clean.Builder, "clean", return_value=True) as mock_clean,
+        ):
+            result = clean.run_clean(Namespace(all=False, build_names=[]))
+
+        assert result is True
+        mock_clean.assert_called_once()
+        assert mock_clean.call_args.args[1].build_name == build.build_name
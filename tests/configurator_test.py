@@ -6,9 +6,18 @@ from shutil import rmtree
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 import amphimixis.core.configurator as configurator
-from amphimixis.core.general import Arch, Project
+from amphimixis.core.general import Arch, Project, tools
+
+
+@pytest.fixture
+def empty_yaml_cache():
+    """Reset the parsed YAML cache before and after the test"""
+    tools._yaml_cache.clear()
+    yield
+    tools._yaml_cache.clear()
 
 
 @pytest.mark.unit
@@ -147,6 +156,20 @@ class TestConfiguratorWithTestData:
 
         assert project.build_system is not None
 
+    def test_parse_config_parses_config_file_once(
+        self, temp_project_dir, mock_shell_remote, empty_yaml_cache
+    ):
+        """Test that unchanged config file is not parsed again
+        Expect: YAML is parsed once for validation and repeated configuration"""
+        project = Project(temp_project_dir)
+
+        with patch.object(yaml, "safe_load", wraps=yaml.safe_load) as safe_load:
+            assert configurator.parse_config(project, self.TEST_CONFIG_FILE)
+            assert configurator.parse_config(project, self.TEST_CONFIG_FILE)
+
+        assert safe_load.call_count == 1
+        assert len(project.builds) == 2
+
     def test_parse_config_invalid_project_path(self):
         """Test parse_config with invalid project path
         Expect: Returns False"""
@@ -165,3 +188,41 @@ class TestConfiguratorWithTestData:
 
         assert result is False
         assert result is False
+
+
+@pytest.mark.unit
+class TestLoadYaml:
+    """Tests for tools.load_yaml caching"""
+
+    def test_load_yaml_reparses_modified_file(self, tmp_path, empty_yaml_cache):
+        """Test that a changed config file is parsed again
+        Expect: YAML is parsed again and the new content is returned"""
+        config_path = str(tmp_path / "input.yml")
+        with open(config_path, "w", encoding="UTF-8") as file:
+            file.write("build_system: cmake\n")
+
+        with patch.object(yaml, "safe_load", wraps=yaml.safe_load) as safe_load:
+            assert tools.load_yaml(config_path) == {"build_system": "cmake"}
+
+            # same size, so only the modification time tells the files apart
+            with open(config_path, "w", encoding="UTF-8") as file:
+                file.write("build_system: ninja\n")
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            assert tools.load_yaml(config_path) == {"build_system": "ninja"}
+
+        assert safe_load.call_count == 2
+
+    def test_load_yaml_returns_independent_copies(self, tmp_path, empty_yaml_cache):
+        """Test that changes of a loaded config don't leak into the cache
+        Expect: Next load returns the original values"""
+        config_path = str(tmp_path / "input.yml")
+        with open(config_path, "w", encoding="UTF-8") as file:
+            file.write("builds:\n  - recipe_id: 1\n")
+
+        config = tools.load_yaml(config_path)
+        config["builds"][0]["recipe_id"] = 2
+        config["build_system"] = "make"
+
+        assert tools.load_yaml(config_path) == {"builds": [{"recipe_id": 1}]}
@@ -0,0 +1,93 @@
+"""ConsoleAnimationPrinter tests"""
+
+import pickle
+
+import pytest
+
+from amphimixis.amixis.console_animation_printer import ConsoleAnimationPrinter
+from amphimixis.core.general import BuildSystem, Project
+
+
+@pytest.mark.unit
+class TestConsoleAnimationPrinter:
+    """Tests for ConsoleAnimationPrinter"""
+
+    def test_project_with_printer_can_be_pickled(self, tmp_path):
+        """Test pickling a project whose build system uses the printer
+        Expect: Project is restored with a working printer"""
+        printer = ConsoleAnimationPrinter()
+        project = Project(str(tmp_path))
+        project.build_system = BuildSystem(project, ui=printer)  # type: ignore
+
+        restored = pickle.loads(pickle.dumps(project))
+
+        restored_printer = restored.build_system._ui
+        assert isinstance(restored_printer, ConsoleAnimationPrinter)
+        assert restored_printer._step_lock is not printer._step_lock
+        restored_printer.frame_interval = 0
+        restored_printer.step()
+        assert restored_printer.index == 1
+
+    def test_draw_skips_unchanged_line(self, capsys):
+        """Test redrawing the same state
+        Expect: Nothing is written to stdout"""
+        printer = ConsoleAnimationPrinter()
+        printer.update_message("build", "Building...")
+        capsys.readouterr()
+
+        printer.draw()
+
+        assert capsys.readouterr().out == ""
+
+    def test_step_coalesces_steps_within_frame_interval(self, capsys):
+        """Test steps coming faster than frame_interval
+        Expect: Spinner advances only once"""
+        printer = ConsoleAnimationPrinter()
+        printer.frame_interval = 60
+        printer.update_message("build", "Building...")
+
+        printer.step()
+        printer.step()
+        printer.step()
+
+        assert printer.index == 1
+
+    def test_step_is_dropped_while_spinner_is_busy(self, capsys):
+        """Test step while another thread holds the step lock
+        Expect: Step is skipped and nothing is written"""
+        printer = ConsoleAnimationPrinter()
+        printer.frame_interval = 0
+        printer.update_message("build", "Building...")
+        capsys.readouterr()
+
+        with printer._step_lock:
+            printer.step()
+
+        assert printer.index == 0
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize(
+        "columns, expected_line",
+        [(10, "[b][⠋] Bu"), (None, "[b][⠋] Building...")],
+    )
+    def test_draw_cuts_frames_to_columns(self, capsys, columns, expected_line):
+        """Test drawing a frame longer than the terminal width
+        Expect: Frame is cut only when the width is known"""
+        printer = ConsoleAnimationPrinter()
+        printer._columns = columns
+
+        printer.update_message("b", "Building...")
+
+        assert capsys.readouterr().out == f"\r\033[K{expected_line}"
+
+    def test_final_line_is_not_cut(self, capsys):
+        """Test marking a build as failed with a message longer than the terminal
+        Expect: Final line is written in full"""
+        printer = ConsoleAnimationPrinter()
+        printer._columns = 10
+        printer.update_message("b", "Building...")
+        capsys.readouterr()
+
+        printer.mark_failed("Building failed")
+
+        assert capsys.readouterr().out == "\r\033[K[b][✗] Building failed\n"